@@ -329,9 +329,10 @@ class BaseCalc(ABC):
         return inputfile, vars(args), args_not_parsed
 
     @classmethod
-    def extend_parser(self, parser: ArgumentParser) -> None:
+    def extend_parser(cls, parser: ArgumentParser) -> None:
         """
         Subclasses override this to add custom arguments.
+        As it is a class method, no calculator has to be instantiated to build a parser.
 
         Parameters
         ----------
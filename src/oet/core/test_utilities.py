@@ -3,13 +3,27 @@ Utilities used in the test suite
 """
 
 import multiprocessing as mp
+import os
+import select
+import signal
+import socket
 import subprocess
+import sys
+import time
+import traceback
+from collections import deque
+from collections.abc import Sequence
+from contextlib import chdir, redirect_stderr, redirect_stdout
 from enum import StrEnum
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
+
+from oet.core.base_calc import BaseCalc
+from oet.server_client.client import UNIX_SOCKET_PREFIX, send_to_server
 
 if TYPE_CHECKING:
     from multiprocessing.queues import Queue
+    from unittest import TestCase
 
 WATER = [
     ("O", 0.0000, 0.0000, 0.0000),
@@ -23,6 +37,25 @@ OH = [
 ]
 
 
+class EngradCase(NamedTuple):
+    """Structure, settings and reference results of an energy and gradient test"""
+
+    # Basename of the files written for the case
+    name: str
+    # Atomic symbols and positions [(symbol, x, y, z), ...]
+    atoms: list[tuple[str, float, float, float]]
+    # Molecular charge
+    charge: int
+    # Multiplicity
+    multiplicity: int
+    # Reference energy in Hartree
+    energy: float
+    # Reference gradient in Hartree/Bohr
+    gradients: tuple[float, ...]
+    # Number of decimal places that must agree
+    places: int = 9
+
+
 def read_result_file(filename: str | Path) -> tuple[int, float, list[float]]:
     """
     Reads the engrad file written by the wrapper
@@ -57,6 +90,40 @@ def read_result_file(filename: str | Path) -> tuple[int, float, list[float]]:
     return num_atoms, energy, gradients
 
 
+def assert_gradients_almost_equal(
+    testcase: "TestCase",
+    gradients: Sequence[float],
+    expected_gradients: Sequence[float],
+    places: int = 7,
+) -> None:
+    """
+    Compares all gradient components at once, each like `assertAlmostEqual`.
+    Unlike a loop over zip, a gradient of the wrong length fails
+    and all deviating components are reported together.
+
+    Parameters
+    ----------
+    testcase: TestCase
+        Test case that reports the failure
+    gradients: Sequence[float]
+        Gradient read from the engrad file
+    expected_gradients: Sequence[float]
+        Reference gradient
+    places: int, default: 7
+        Number of decimal places that must agree
+    """
+    testcase.assertEqual(
+        len(gradients), len(expected_gradients), "Number of gradient components differs"
+    )
+    deviations = [
+        f"component {i}: {g} != {ref}"
+        for i, (g, ref) in enumerate(zip(gradients, expected_gradients))
+        if round(abs(g - ref), places) != 0
+    ]
+    if deviations:
+        testcase.fail(f"Gradients differ within {places} places:\n" + "\n".join(deviations))
+
+
 def write_input_file(
     filename: str | Path,
     xyz_filename: str,
@@ -129,15 +196,82 @@ def write_xyz_file(filename: str | Path, atoms: list[tuple[str, float, float, fl
             f.write(f"{symbol} {x:.4f} {y:.4f} {z:.4f}\n")
 
 
+def write_engrad_case(case: EngradCase, ncores: int = 2) -> tuple[str, str, str, str]:
+    """
+    Write the structure and the input file of a test case.
+    Existing files of the case are removed first.
+
+    Parameters
+    ----------
+    case: EngradCase
+        Test case to write
+    ncores: int, default: 2
+        Number of cores to use
+
+    Returns
+    -------
+    tuple[str, str, str, str]: names of the structure, input, engrad and output file
+    """
+    xyz_file, input_file, engrad_out, output_file = get_filenames(case.name)
+    write_xyz_file(xyz_file, case.atoms)
+    write_input_file(
+        filename=input_file,
+        xyz_filename=xyz_file,
+        charge=case.charge,
+        multiplicity=case.multiplicity,
+        ncores=ncores,
+        do_gradient=1,
+    )
+    return xyz_file, input_file, engrad_out, output_file
+
+
+def check_engrad_case(
+    testcase: "TestCase", case: EngradCase, engrad_out: str, output_file: str, exit_code: int
+) -> None:
+    """
+    Compare the engrad file written for a test case with its reference results
+
+    Parameters
+    ----------
+    testcase: TestCase
+        Test case that reports the failure
+    case: EngradCase
+        Test case with the reference results
+    engrad_out: str
+        Engrad file written by the wrapper
+    output_file: str
+        Output of the wrapper, referred to if the wrapper failed
+    exit_code: int
+        Exit code of the wrapper
+    """
+    if exit_code != 0:
+        testcase.fail(
+            f"Wrapper exited with {exit_code}. Check {output_file} for details. "
+            f"Its last lines are:\n{tail_of_file(output_file)}"
+        )
+    try:
+        num_atoms, energy, gradients = read_result_file(engrad_out)
+    except Exception as e:
+        raise FileNotFoundError(
+            f"Error wrapper outputfile not found. Check {output_file} for details. "
+            f"Its last lines are:\n{tail_of_file(output_file)}"
+        ) from e
+
+    testcase.assertEqual(num_atoms, len(case.atoms))
+    testcase.assertAlmostEqual(energy, case.energy, places=case.places)
+    assert_gradients_almost_equal(testcase, gradients, case.gradients, places=case.places)
+
+
 def run_wrapper(
     inputfile: str | Path,
     script_path: str | Path,
     outfile: str | Path,
     args: list[str] | None = None,
     timeout: float | None = 10.0,
-) -> None:
+) -> int:
     """
-    Run the wrapper
+    Run the wrapper. Each call should get its own output file,
+    so that wrappers running at the same time don't write to the same file.
 
     Parameters
     ----------
@@ -151,13 +285,306 @@ def run_wrapper(
         Additional arguments
     timeout: float | None, default: 10 s
         Default timeout time (seconds)
+
+    Returns
+    -------
+    int: exit code of the wrapper
     """
     cmd = [script_path, inputfile]
     if args:
         cmd += args
 
-    with open(outfile, "w") as f:
-        subprocess.run(cmd, stdout=f, stderr=subprocess.STDOUT, timeout=timeout)
+    # The wrapper writes directly to the file, nothing is buffered on the Python side
+    with open(outfile, "wb") as f:
+        return subprocess.run(
+            cmd, stdout=f, stderr=subprocess.STDOUT, timeout=timeout, check=False
+        ).returncode
+
+
+def run_client(
+    inputfile: str | Path,
+    host_port: str,
+    outfile: str | Path,
+    args: list[str] | None = None,
+) -> int:
+    """
+    Send a calculation to a running server like oet_client, but from within the test process.
+    This saves starting a new Python interpreter for every calculation.
+
+    Parameters
+    ----------
+    inputfile: str | Path
+        Inputfile
+    host_port: str
+        Host:Port of the server
+    outfile: str | Path
+        File to write the output to
+    args: list[str] | None, default = None
+        Additional arguments for the calculator
+
+    Returns
+    -------
+    int: exit code oet_client would have returned
+    """
+    arguments = [str(inputfile)]
+    if args:
+        arguments += args
+
+    with open(outfile, "w") as f, redirect_stdout(f), redirect_stderr(f):
+        try:
+            send_to_server(host_port=host_port, arguments=arguments)
+        except SystemExit as e:
+            # The client exits on errors after printing them
+            return e.code if isinstance(e.code, int) else 1
+    return 0
+
+
+def run_calculator(
+    calculator: BaseCalc,
+    inputfile: str | Path,
+    outfile: str | Path,
+    args: list[str] | None = None,
+) -> int:
+    """
+    Run a calculation like the standalone wrapper, but with a calculator of the test process.
+    Reusing the calculator saves starting a new interpreter and, e.g., reloading a model.
+
+    Parameters
+    ----------
+    calculator: BaseCalc
+        Calculator that performs the calculation
+    inputfile: str | Path
+        Inputfile
+    outfile: str | Path
+        File to write the output to
+    args: list[str] | None, default = None
+        Additional arguments for the calculator
+
+    Returns
+    -------
+    int: exit code the wrapper would have returned
+    """
+    arguments = [str(inputfile)]
+    if args:
+        arguments += args
+
+    # BaseCalc.run changes into the scratch directory and only changes back on success
+    with chdir(Path.cwd()), open(outfile, "w") as f, redirect_stdout(f), redirect_stderr(f):
+        try:
+            inputfile, args_parsed, args_not_parsed = calculator.parse_args(arguments)
+            calculator.run(
+                inputfile=inputfile, args_parsed=args_parsed, args_not_parsed=args_not_parsed
+            )
+        except SystemExit as e:
+            # argparse exits, e.g., on invalid arguments or --version, after printing its message
+            if isinstance(e.code, int) or e.code is None:
+                return e.code or 0
+            print(e.code, file=sys.stderr)
+            return 1
+        except Exception:
+            # Write the error to the output file like an uncaught exception of the wrapper
+            traceback.print_exc()
+            return 1
+    return 0
+
+
+def tail_of_file(filename: str | Path, nlines: int = 20) -> str:
+    """
+    Returns the last lines of a file, e.g., to show why a wrapper failed
+
+    Parameters
+    ----------
+    filename: str | Path
+        File to read
+    nlines: int, default: 20
+        Maximum number of lines
+
+    Returns
+    -------
+    str: the last lines or a note if the file can't be read
+    """
+    try:
+        with open(filename, errors="replace") as f:
+            return "".join(deque(f, maxlen=nlines))
+    except OSError:
+        return f"<{filename} could not be read>"
+
+
+def _open_pidfd(process: "subprocess.Popen[Any]") -> int | None:
+    """
+    Open a file descriptor that becomes readable when the process exits
+
+    Parameters
+    ----------
+    process: subprocess.Popen
+        Running process
+
+    Returns
+    -------
+    int | None: pidfd of the process, None if not supported by the platform or the process is gone
+    """
+    if not hasattr(os, "pidfd_open"):
+        return None
+    try:
+        return os.pidfd_open(process.pid)
+    except OSError:
+        return None
+
+
+def _accepts_connections(host_port: str) -> bool:
+    """
+    Check once whether a server accepts connections
+
+    Parameters
+    ----------
+    host_port: str
+        Host:Port the server is bound to or unix:/path/to/socket
+
+    Returns
+    -------
+    bool: True if a connection could be established
+    """
+    try:
+        if host_port.startswith(UNIX_SOCKET_PREFIX):
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(0.2)
+                sock.connect(host_port.removeprefix(UNIX_SOCKET_PREFIX))
+        else:
+            host, port = host_port.split(":")
+            with socket.create_connection((host, int(port)), timeout=0.2):
+                pass
+    except OSError:
+        return False
+    return True
+
+
+def wait_for_server(
+    host_port: str, server: "subprocess.Popen[Any] | None" = None, timeout: float = 60.0
+) -> None:
+    """
+    Wait until a server accepts connections instead of sleeping for a fixed time
+
+    Parameters
+    ----------
+    host_port: str
+        Host:Port the server is bound to or unix:/path/to/socket
+    server: subprocess.Popen | None, default: None
+        Process of the server. If given, stop waiting as soon as it exits.
+    timeout: float, default: 60 s
+        Maximum time to wait (seconds)
+
+    Raises
+    ------
+    RuntimeError: If the server exited or did not accept connections in time
+    """
+    deadline = time.monotonic() + timeout
+    # On Linux, a pidfd of the server becomes readable when it exits,
+    # so the pause between two connection attempts ends early on a crash
+    pidfd = _open_pidfd(server) if server is not None else None
+    delay = 0.01
+    try:
+        while (remaining := deadline - time.monotonic()) > 0:
+            if server is not None and server.poll() is not None:
+                raise RuntimeError(f"Server exited with code {server.returncode}")
+            if _accepts_connections(host_port):
+                return
+            if pidfd is not None:
+                select.select([pidfd], [], [], min(delay, remaining))
+            else:
+                time.sleep(min(delay, remaining))
+            delay = min(2 * delay, 0.2)
+    finally:
+        if pidfd is not None:
+            os.close(pidfd)
+    raise RuntimeError(f"Server on {host_port} did not start within {timeout} s")
+
+
+def _wait_for_exit(process: "subprocess.Popen[Any]", timeout: float) -> bool:
+    """
+    Wait for a process to exit, returning as soon as it has
+
+    Parameters
+    ----------
+    process: subprocess.Popen
+        Running process
+    timeout: float
+        Maximum time to wait (seconds)
+
+    Returns
+    -------
+    bool: True if the process exited in time
+    """
+    pidfd = _open_pidfd(process)
+    if pidfd is None:
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            return False
+        return True
+    try:
+        select.select([pidfd], [], [], timeout)
+    finally:
+        os.close(pidfd)
+    return process.poll() is not None
+
+
+def start_server(
+    command: Sequence[str | Path],
+    env: dict[str, str] | None = None,
+    logfile: str | Path = "server.out",
+) -> "subprocess.Popen[bytes]":
+    """
+    Start a server in its own process group, so that stop_server can shut down all its processes.
+    The server log is only written to `logfile` if the environment variable OET_TEST_VERBOSE is set.
+
+    Parameters
+    ----------
+    command: Sequence[str | Path]
+        Command starting the server
+    env: dict[str, str] | None, default: None
+        Environment of the server. If None, the current environment is used.
+    logfile: str | Path, default: server.out
+        File the server log is appended to
+
+    Returns
+    -------
+    subprocess.Popen: Process of the server
+    """
+    if not os.environ.get("OET_TEST_VERBOSE"):
+        print(f"Starting the server. Set OET_TEST_VERBOSE=1 to write its log to {logfile}")
+        return subprocess.Popen(
+            command,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.STDOUT,
+            env=env,
+            start_new_session=True,
+        )
+    print(f"Starting the server. A detailed server log can be found on file {logfile}")
+    with open(logfile, "ab") as f:
+        return subprocess.Popen(
+            command, stdout=f, stderr=subprocess.STDOUT, env=env, start_new_session=True
+        )
+
+
+def stop_server(server: "subprocess.Popen[Any]", timeout: float = 10.0) -> None:
+    """
+    Stop a server that was started in its own process group.
+    The whole group gets SIGTERM first and SIGKILL if it did not exit in time.
+
+    Parameters
+    ----------
+    server: subprocess.Popen
+        Process of the server
+    timeout: float, default: 10 s
+        Maximum time to wait for the server to shut down after SIGTERM (seconds)
+    """
+    if server.poll() is not None:
+        return
+    pgid = os.getpgid(server.pid)
+    os.killpg(pgid, signal.SIGTERM)
+    if not _wait_for_exit(server, timeout):
+        os.killpg(pgid, signal.SIGKILL)
+        server.wait()
 
 
 def add_arguments(args: str | list[str], additions: list[str]) -> list[str]:
@@ -195,10 +622,12 @@ def get_filenames(basename: str) -> tuple[str, str, str, str]:
 
 def clear_files(basename: str) -> None:
     """
-    Remove every file starting with basename
+    Remove every file named basename.<ext>
+    Files of other tests, e.g., OH_anion.* for basename OH, are left alone,
+    so that tests can run concurrently in the same directory.
     """
     dir_path = Path.cwd()
-    for f in dir_path.glob(basename + "*"):
+    for f in dir_path.glob(basename + ".*"):
         if f.is_file():
             f.unlink()  # remove file
 
@@ -3,15 +3,74 @@
 Module for sending input to server
 """
 
+import http.client
+import json
 import os
+import socket
 import sys
 import traceback
 from argparse import ArgumentParser
+from typing import Any
 
 import requests
 
 from oet import __version__ as version
 
+# Prefix of a bind address that refers to a Unix domain socket, e.g., unix:/tmp/oet.sock
+UNIX_SOCKET_PREFIX = "unix:"
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection to a server listening on a Unix domain socket."""
+
+    def __init__(self, socket_path: str):
+        super().__init__("localhost")
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.socket_path)
+
+
+def post_unix_socket(socket_path: str, payload: dict[str, Any]) -> Any:
+    """
+    Sends the payload to the calculate endpoint of a server listening on a Unix domain socket.
+
+    Parameters
+    ----------
+    socket_path: str
+        Path to the socket of the server
+    payload: dict[str, Any]
+        Content of the request
+
+    Returns
+    -------
+    Any
+        Decoded JSON response of the server
+
+    Raises
+    ------
+    requests.exceptions.ConnectionError: If the server can't be reached
+    requests.exceptions.HTTPError: If the server responds with an error status
+    """
+    conn = UnixHTTPConnection(socket_path)
+    try:
+        conn.request(
+            "POST",
+            "/calculate",
+            body=json.dumps(payload),
+            headers={"Content-Type": "application/json"},
+        )
+        response = conn.getresponse()
+        body = response.read()
+    except OSError as e:
+        raise requests.exceptions.ConnectionError(e) from e
+    finally:
+        conn.close()
+    if response.status >= 400:
+        raise requests.exceptions.HTTPError(f"{response.status} {response.reason}")
+    return json.loads(body)
+
 
 def send_to_server(
     host_port: str,
@@ -23,25 +82,31 @@ def send_to_server(
     Parameters
     ----------
     host_port: str
-        Host:Port of the server
+        Host:Port of the server or unix:/path/to/socket
     inputfile: str
         Name of the inputfile written by ORCA
     nthreads : int
         Number of threads to use for the calculation
     """
 
-    host, port = host_port.split(":")
-    url = f"http://{host}:{port}/calculate"
     payload = {"arguments": arguments, "directory": os.getcwd()}
     try:
-        response = requests.post(url, json=payload)
-        response.raise_for_status()
-        data = response.json()
+        if host_port.startswith(UNIX_SOCKET_PREFIX):
+            # No TCP connection is needed if server and client run on the same machine
+            data = post_unix_socket(host_port.removeprefix(UNIX_SOCKET_PREFIX), payload)
+        else:
+            host, port = host_port.split(":")
+            url = f"http://{host}:{port}/calculate"
+            response = requests.post(url, json=payload)
+            response.raise_for_status()
+            data = response.json()
         # print the stdout of the calculation, if any
         print(data.get("stdout", ""), end="")
         if data.get("status") == "Error":
             print(f"Server error {data.get('error_type')}: {data.get('error_message')}.")
-            print(f"Exact traceback: {data.get('traceback')}")
+            # The traceback is only sent by a verbose server
+            if "traceback" in data:
+                print(f"Exact traceback: {data['traceback']}")
             sys.exit(1)
     except requests.exceptions.Timeout:
         print("Connection timed out.")
@@ -73,7 +138,7 @@ def client() -> None:
         metavar="hostname:port",
         default="127.0.0.1:8888",
         dest="host_port",
-        help="Server bind address and port. Default: 127.0.0.1:8888.",
+        help="Server bind address and port or unix:/path/to/socket. Default: 127.0.0.1:8888.",
     )
 
     args, remaining_args = parser.parse_known_args(sys.argv[1:])
@@ -12,59 +12,100 @@ function: main
 
 from __future__ import annotations
 
-import argparse
-import concurrent
-import concurrent.futures
 import contextlib
+import functools
 import gc
 import importlib
 import io
+import json
 import logging
 import multiprocessing as mp
 import os
 import signal
+import socket
+import stat
 import sys
 import threading
 import time
-import traceback
 import typing
 from argparse import Action, ArgumentParser
-from collections import OrderedDict
-from collections.abc import Mapping, Sequence
+from collections import OrderedDict, deque
+from collections.abc import Iterator, Mapping, Sequence
 from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
 from contextlib import redirect_stdout
+from multiprocessing.context import BaseContext
 from pathlib import Path
 from types import FrameType
 from typing import Any
 
 import psutil
-from flask import Flask, Response, jsonify, request
-from waitress import serve
+from flask import Flask, Response, request
 
 from oet import __version__ as version
 from oet.core.base_calc import CALCULATOR_CLASSES, BaseCalc
 from oet.core.misc import get_ncores_from_input
+from oet.server_client.client import UNIX_SOCKET_PREFIX
 
 if typing.TYPE_CHECKING:
     from argparse import Namespace
 
 
+# Number of request threads in addition to `nthreads`.
+# These handle lightweight requests while all cores are busy with calculations.
+_EXTRA_REQUEST_THREADS = 2
+
+# Body of the health check response, which never changes
+_HEALTHZ_BODY = json.dumps({"status": "OK"}).encode()
+
+# Settings of a worker process. They are the same for all jobs and are therefore
+# set once by `worker_initializer` instead of being sent along with every job.
+# The calculator class, only looked up once per worker
+_WORKER_CALC_TYPE: type[BaseCalc] | None = None
+# Maximum memory in MiB
+_WORKER_MAX_MEMORY = 0
+
 # Cache of initialized calculators: each worker process populates its own copy of the cache
 # This guarantees that for calculators which are inadvertently not thread-safe
 # (because they temporarily hold calculation data in member variables)
 # we never use the same instance by multiple processes in parallel.
-# key: (module, class, frozenset(setup_items)) -> calc instance
+# key: (parsed args, not parsed args) -> calc instance
+# The calculator class is the same for all entries, so it is not part of the key.
 # OrderedDict, where the most currently used entry is moved to the end
-_WORKER_CALC_CACHE: "OrderedDict[tuple[str, str, frozenset[tuple[str, Any]]], Any]" = OrderedDict()
+_CalcKey = tuple[tuple[tuple[str, Any], ...], tuple[str, ...]]
+_WORKER_CALC_CACHE: "OrderedDict[_CalcKey, Any]" = OrderedDict()
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Converts (possibly nested) lists, sets and dicts into tuples/frozensets, so that they can be used in a cache key.
+    Argparse creates lists, e.g., for options with `nargs`.
+
+    Parameters
+    ----------
+    value: Any
+        Value to convert
+
+    Returns
+    -------
+    Any
+        Hashable version of the value
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
 
 
-def _pop_one_worker(protected_key: tuple[str, str, frozenset[tuple[str, Any]]] | None) -> bool:
+def _pop_one_worker(protected_key: _CalcKey | None) -> bool:
     """
     Removes left most worker that isn't protected
 
     Parameters
     ----------
-    protected_key: tuple[str, str, frozenset[tuple[str, Any]]] | None
+    protected_key: _CalcKey | None
         Protected keys that should not be deleted.
 
     Returns
@@ -83,9 +124,7 @@ def _pop_one_worker(protected_key: tuple[str, str, frozenset[tuple[str, Any]]] |
     return False
 
 
-def _evict_until_within_limits(
-    mem_limit_mib: int, protected_key: tuple[str, str, frozenset[tuple[str, Any]]] | None
-) -> None:
+def _evict_until_within_limits(mem_limit_mib: int, protected_key: _CalcKey | None) -> None:
     """
     Evict least-recently-used calculators until the memory limit is satisfied.
     `protect_key` (if given) will not be evicted (skip over it).
@@ -94,7 +133,7 @@ def _evict_until_within_limits(
     ----------
     mem_limit_mib: int
         Maximum memory usable by server in MiB
-    protected_key: tuple[str, str, frozenset[tuple[str, Any]]]
+    protected_key: _CalcKey | None
         The one that should not be deleted from the _WORKER_CALC_CACHE
     """
     # RSS-based eviction (only if we can read RSS and a limit is set)
@@ -125,6 +164,49 @@ def _evict_until_within_limits(
     logging.debug(f"PID {os.getpid()}: Memory use after: {rss} / {target}")
 
 
+@functools.lru_cache(maxsize=1024)
+def _resolve_dir(directory: str) -> str:
+    """
+    Resolves a directory to an absolute path.
+    Clients usually send the same directory over and over again, so it is only resolved once.
+    The returned string is interned, so repeated requests also reuse the same string object.
+
+    Parameters
+    ----------
+    directory: str
+        Directory to resolve
+
+    Returns
+    -------
+    str
+        Interned absolute path of the directory
+    """
+    return sys.intern(os.path.realpath(directory))
+
+
+@functools.lru_cache(maxsize=1024)
+def _ncores_cached(inputfile: str, mtime_ns: int, size: int) -> int:
+    """
+    Reads the number of cores from the input file.
+    Modification time and size are part of the cache key, so a modified file is read again.
+
+    Parameters
+    ----------
+    inputfile: str
+        Input file to read from
+    mtime_ns: int
+        Modification time of the input file in ns
+    size: int
+        Size of the input file in bytes
+
+    Returns
+    -------
+    int
+        Number of cores
+    """
+    return get_ncores_from_input(inputfile)
+
+
 class CalculatorRuntimeException(RuntimeError):
     """Custom exception class to pass STDOUT to the client along with any runtime error."""
 
@@ -132,23 +214,16 @@ class CalculatorRuntimeException(RuntimeError):
         self.stdout = stdout
 
 
-def _run_calc_in_process(
-    calc_module: str, calc_class: str, run_kwargs: dict[str, Any], max_memory_per_thread: int
-) -> str:
+def _run_calc_in_process(run_kwargs: dict[str, Any]) -> str:
     """
     Worker entrypoint. Runs in a separate process.
     We lazily create & cache a calculator instance per unique setup.
+    The calculator type and memory limit are taken from the worker settings (see `worker_initializer`).
 
     Parameters
     ----------
-    calc_module: str
-        Module to load for calculator
-    calc_class: str
-        Calculator type
     run_kwargs: dict
         Infos from client about the run
-    max_memory_per_thread: int
-        Maximum memory in MiB
 
     Returns
     -------
@@ -156,22 +231,19 @@ def _run_calc_in_process(
         The STDOUT of the calculator's `run` function
     """
 
-    # Make run_kwargs with only method-specific settings
+    # Make the key from only method-specific settings
     # It is assumed that all not parsed arguments are also method specific
-    args_parsed_frozen = tuple(sorted(run_kwargs["args_parsed"].items()))
-    args_not_parsed_frozen = tuple(run_kwargs["args_not_parsed"])
-    method_specific_args = {
-        "args_parsed": args_parsed_frozen,
-        "args_not_parsed": args_not_parsed_frozen,
-    }
-    # Use those to check if a calculator with these settings already exists.
+    # Use it to check if a calculator with these settings already exists.
     # If not, make another one and delete old calculators if it would exceed the current memory limit.
-    key = (calc_module, calc_class, frozenset(method_specific_args.items()))
+    key: _CalcKey = (
+        _freeze(run_kwargs["args_parsed"]),
+        tuple(run_kwargs["args_not_parsed"]),
+    )
     calc = _WORKER_CALC_CACHE.get(key)
     if calc is None:
-        mod = importlib.import_module(calc_module)
-        Cls = getattr(mod, calc_class)
-        calc = Cls()
+        if _WORKER_CALC_TYPE is None:
+            raise RuntimeError("Worker process was not initialized")
+        calc = _WORKER_CALC_TYPE()
         _WORKER_CALC_CACHE[key] = calc
         logging.debug(f"PID {os.getpid()}: Initialized new calculator with id: {key}")
     else:
@@ -180,7 +252,7 @@ def _run_calc_in_process(
     _WORKER_CALC_CACHE.move_to_end(key)
 
     # Evict old entries if max memory is used, but never evict the one that is used
-    _evict_until_within_limits(max_memory_per_thread, protected_key=key)
+    _evict_until_within_limits(_WORKER_MAX_MEMORY, protected_key=key)
     # Run calc.run and return its STDOUT
     buf = io.StringIO()
     try:
@@ -196,6 +268,8 @@ class CoreLimiter:
     """
     Enforces a global core budget across concurrent jobs.
     Blocks until enough cores are free.
+    Waiting jobs are served in order of arrival and only the waiters that can actually
+    start are woken up when cores are released.
     """
 
     def __init__(self, total_cores: int) -> None:
@@ -203,8 +277,10 @@ class CoreLimiter:
         self.total = int(total_cores)
         # Available cores of server
         self.available = int(total_cores)
-        # Waiting
-        self._cv = threading.Condition()
+        # Protects `available` and `_waiters`
+        self._lock = threading.Lock()
+        # Waiting jobs (requested cores, event set when the cores are assigned), FIFO
+        self._waiters: deque[tuple[int, threading.Event]] = deque()
 
     def acquire(self, n: int) -> None:
         """
@@ -216,13 +292,18 @@ class CoreLimiter:
             Number of cores that are requested for the job
         """
         n = int(n)
-        with self._cv:
+        with self._lock:
             if n > self.total:
                 # Fail fast: this job can never run on this server
                 raise ValueError(f"Requested {n} cores but only {self.total} total available.")
-            while n > self.available:
-                self._cv.wait()
-            self.available -= n
+            # Only take the cores directly if no other job is waiting already
+            if not self._waiters and n <= self.available:
+                self.available -= n
+                return
+            assigned = threading.Event()
+            self._waiters.append((n, assigned))
+        # The cores are reserved by `release` before the event is set
+        assigned.wait()
 
     def release(self, n: int) -> None:
         """
@@ -234,11 +315,32 @@ class CoreLimiter:
             Number of cores to release
         """
         n = int(n)
-        with self._cv:
+        with self._lock:
             self.available += n
             if self.available > self.total:
                 self.available = self.total
-            self._cv.notify_all()
+            # Hand the cores to the waiting jobs in order of arrival.
+            # Stop at the first one that doesn't fit, so that large jobs are not starved.
+            while self._waiters and self._waiters[0][0] <= self.available:
+                n_waiter, assigned = self._waiters.popleft()
+                self.available -= n_waiter
+                assigned.set()
+
+    @contextlib.contextmanager
+    def reserve(self, n: int) -> Iterator[None]:
+        """
+        Context manager holding `n` cores for the duration of the block
+
+        Parameters
+        ----------
+        n: int
+            Number of cores that are requested for the job
+        """
+        self.acquire(n)
+        try:
+            yield
+        finally:
+            self.release(n)
 
 
 class CalculatorClass:
@@ -268,13 +370,12 @@ class CalculatorClass:
 
     def build_full_parser(self, parser: ArgumentParser) -> None:
         """
-        Extends the given argument parser by calling the class method `extend_parser` of the calculator class
+        Extends the given argument parser by calling the class method `extend_parser` of the calculator class.
+        The hook is called on the class itself, so no (potentially expensive) calculator instance is created.
 
         parser: ArgumentParser
             Parser to be extended
         """
-        if self._cls is None:
-            raise RuntimeError("Call set_calculator_type() first.")
         self._cls.extend_parser(parser)
 
 
@@ -284,7 +385,6 @@ class OtoolServer:
         calc_class: CalculatorClass,
         total_cores: int,
         executor: ProcessPoolExecutor,
-        max_memory_per_thread: int,
     ):
         # Calculator class used to build parser
         self.calc_class = calc_class
@@ -295,8 +395,11 @@ class OtoolServer:
         # Mechanism to handle a broken executor
         self._executor_lock = threading.Lock()
         self._executor_broken = False
-        # Maximum memory of the server in MiB
-        self.max_memory_per_thread = max_memory_per_thread
+        # Parser for the client arguments, built once and reused for every request
+        self._client_parser = self._build_client_parser()
+        # Clients usually send the same arguments over and over again (e.g. during an optimization),
+        # so the parsing results are cached by the arguments
+        self._parse_cached = functools.lru_cache(maxsize=256)(self._parse)
 
     def handle_client(self, content: Mapping[str, Any]) -> dict[str, Any]:
         """
@@ -318,62 +421,81 @@ class OtoolServer:
                 raise RuntimeError("Server unavailable")
 
         arguments: Sequence[str] = content["arguments"]
-        working_dir = Path(content["directory"]).resolve()
+        working_dir = _resolve_dir(content["directory"])
 
         # Parse client args
         inputfile, args, args_not_parsed = self.parse_client_input(arguments)
 
         # Make inputfile absolute (per-request, thread-safe)
-        inputfile_path = (working_dir / inputfile).resolve()
+        inputfile_path = sys.intern(os.path.realpath(os.path.join(working_dir, inputfile)))
 
         # Get per-job core demand
-        ncores_job = get_ncores_from_input(inputfile_path)
+        # The input file is only read again if it was modified
+        try:
+            st = os.stat(inputfile_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Input file not found: {inputfile_path}") from None
+        ncores_job = _ncores_cached(inputfile_path, st.st_mtime_ns, st.st_size)
 
         # Gate by cores
-        self.core_limiter.acquire(ncores_job)
-        try:
-            # Submit the job to a separate process
-            run_kwargs = {
-                "inputfile": str(inputfile_path),
-                "args_parsed": args,
-                "args_not_parsed": args_not_parsed,
-                "directory": str(working_dir),
-            }
-            fut = self.executor.submit(
-                _run_calc_in_process,
-                self.calc_class.import_module,
-                self.calc_class.calculator_name,
-                run_kwargs,
-                self.max_memory_per_thread,
-            )
-            # Will raise if the worker raised
-            output = fut.result()
-        except BrokenExecutor as e:
-            # If a worker process gets killed, e.g. by the OS's OOM killer, the process pool gets broken
-            # and any subsequent requests will hang. The executor must be stopped and possibly restarted.
-            # Mark it as broken to prevent other requests from hanging.
-            with self._executor_lock:
-                if not self._executor_broken:
-                    self._executor_broken = True
-
-                    # Since new requests are also likely to get killed, just kill the server completely.
-                    # No need to do it asynchronously, so as not to leave and client requests hanging.
-                    def _shutdown() -> None:
-                        # Short delay to flush responses
-                        time.sleep(0.5)
-                        os.kill(os.getpid(), signal.SIGTERM)
-
-                    threading.Thread(target=_shutdown, daemon=True).start()
-            # Pass the exception up and to the client
-            raise RuntimeError(
-                "A worker process was terminated unexpectedly: server shutting down"
-            ) from e
-        except:
-            raise
-        else:
-            return {"status": "Success", "stdout": output}
-        finally:
-            self.core_limiter.release(ncores_job)
+        with self.core_limiter.reserve(ncores_job):
+            try:
+                # Submit the job to a separate process
+                run_kwargs = {
+                    "inputfile": inputfile_path,
+                    "args_parsed": args,
+                    "args_not_parsed": args_not_parsed,
+                    "directory": working_dir,
+                }
+                # Only the per-request data is sent, the rest is known by the workers
+                fut = self.executor.submit(_run_calc_in_process, run_kwargs)
+                # Will raise if the worker raised
+                output = fut.result()
+            except BrokenExecutor as e:
+                # If a worker process gets killed, e.g. by the OS's OOM killer, the process pool gets broken
+                # and any subsequent requests will hang. The executor must be stopped and possibly restarted.
+                # Mark it as broken to prevent other requests from hanging.
+                with self._executor_lock:
+                    if not self._executor_broken:
+                        self._executor_broken = True
+
+                        # Since new requests are also likely to get killed, just kill the server completely.
+                        # No need to do it asynchronously, so as not to leave and client requests hanging.
+                        def _shutdown() -> None:
+                            # Short delay to flush responses
+                            time.sleep(0.5)
+                            os.kill(os.getpid(), signal.SIGTERM)
+
+                        threading.Thread(target=_shutdown, daemon=True).start()
+                # Pass the exception up and to the client
+                raise RuntimeError(
+                    "A worker process was terminated unexpectedly: server shutting down"
+                ) from e
+            except:
+                raise
+            else:
+                return {"status": "Success", "stdout": output}
+
+    def _build_client_parser(self) -> ArgumentParser:
+        """
+        Builds the parser for the arguments sent by the client
+
+        Returns
+        -------
+        ArgumentParser
+            Parser with the input file and the calculator-specific arguments
+        """
+        # First server-related settings
+        parser = ArgumentParser(
+            prog="oet_server",
+            description="Client arguments parser.",
+        )
+        parser.add_argument("inputfile")
+
+        # Let the calculator define its per-request flags
+        self.calc_class.build_full_parser(parser)
+
+        return parser
 
     def parse_client_input(self, arguments: Sequence[str]) -> tuple[str, dict[str, Any], list[str]]:
         """
@@ -393,17 +515,30 @@ class OtoolServer:
         list[str]
             not parsed settings
         """
-        # First server-related settings
-        parser = ArgumentParser(
-            prog="oet_server",
-            description="Client arguments parser.",
-        )
-        parser.add_argument("inputfile")
+        inputfile, args_dict, remaining_args = self._parse_cached(tuple(arguments))
+        # Return copies, so that the cached results cannot be modified
+        return inputfile, dict(args_dict), list(remaining_args)
 
-        # Let the calculator define its per-request flags
-        self.calc_class.build_full_parser(parser)
+    def _parse(self, arguments: tuple[str, ...]) -> tuple[str, dict[str, Any], list[str]]:
+        """
+        Parses the client arguments, see `parse_client_input`
 
-        args, remaining_args = parser.parse_known_args(arguments)
+        Parameters
+        ----------
+        arguments: tuple[str, ...]
+            Arguments from client
+
+        Returns
+        -------
+        str
+            inputfile name
+        dict
+            parsed settings
+        list[str]
+            not parsed settings
+        """
+        # The parser is not modified by parsing, so it can be shared by all request threads
+        args, remaining_args = self._client_parser.parse_known_args(arguments)
 
         # Transform to dict
         args_dict = vars(args)
@@ -412,67 +547,136 @@ class OtoolServer:
         return inputfile, args_dict, remaining_args
 
 
-def create_app(server: OtoolServer) -> Flask:
+def _json_response(content: Mapping[str, Any]) -> Response:
+    """
+    Serializes the content to a JSON response.
+    Unlike `jsonify`, no application context or JSON provider is involved.
+
+    Parameters
+    ----------
+    content: Mapping[str, Any]
+        Content of the response
+
+    Returns
+    -------
+    Response
+        Response with mimetype application/json
+    """
+    return Response(json.dumps(content), mimetype="application/json")
+
+
+def _error_response(error_message: str, error_type: str = "ValueError") -> Response:
+    """
+    Builds the response for a request that could not be handled.
+
+    Parameters
+    ----------
+    error_message: str
+        Message shown to the client
+    error_type: str, default: "ValueError"
+        Type of the error shown to the client
+
+    Returns
+    -------
+    Response
+        Response with the error
+    """
+    return _json_response(
+        {
+            "status": "Error",
+            "error_message": error_message,
+            "error_type": error_type,
+        }
+    )
+
+
+def _parse_payload(raw: bytes) -> tuple[list[str], str] | str:
+    """
+    Parses and validates the payload of a calculation request in one pass.
+
+    Parameters
+    ----------
+    raw: bytes
+        Request body
+
+    Returns
+    -------
+    tuple[list[str], str] | str
+        The arguments and the directory of the request or an error message if the payload is invalid
+    """
+    try:
+        data = json.loads(raw)
+    except ValueError:
+        return "Invalid JSON payload"
+    if not isinstance(data, dict):
+        return "Invalid JSON payload"
+    arguments = data.get("arguments")
+    directory = data.get("directory")
+    if (
+        not isinstance(arguments, list)
+        or not all(isinstance(arg, str) for arg in arguments)
+        or not isinstance(directory, str)
+    ):
+        return "Payload must have list 'arguments' and str 'directory'"
+    return arguments, directory
+
+
+def create_app(server: OtoolServer, send_traceback: bool = False) -> Flask:
     """
     Takes the OtoolServer and returns a Flask application
+
+    Parameters
+    ----------
+    server: OtoolServer
+        Server that handles the calculation requests
+    send_traceback: bool, default: False
+        Whether the full traceback of a failed request is sent to the client.
+        Otherwise, it is only logged by the server.
     """
     app = Flask(__name__)
 
     @app.get("/healthz")
     def healthz() -> Response:
-        return jsonify({"status": "OK"})
+        # A response object can be modified by Flask, so only its body is reused
+        return Response(_HEALTHZ_BODY, mimetype="application/json")
 
     @app.post("/calculate")
     def calculate() -> Response:
         try:
-            data = request.get_json(force=True, silent=False)
-            if not isinstance(data, dict):
-                return jsonify(
-                    {
-                        "status": "Error",
-                        "error_message": "Invalid JSON payload",
-                        "error_type": "ValueError",
-                    }
-                )
-
-            arguments = data.get("arguments")
-            directory = data.get("directory")
-
-            if not isinstance(arguments, list) or not isinstance(directory, str):
-                return jsonify(
-                    {
-                        "status": "Error",
-                        "error_message": "Payload must have list 'arguments' and str 'directory'",
-                        "error_type": "ValueError",
-                    }
-                )
-
-            # Validate directory exists and is a dir
-            p = Path(directory)
-            if not p.exists() or not p.is_dir():
-                return jsonify(
-                    {
-                        "status": "Error",
-                        "error_message": f"Invalid directory: {p}",
-                        "error_type": "ValueError",
-                    }
-                )
+            payload = _parse_payload(request.get_data())
+            if isinstance(payload, str):
+                return _error_response(payload)
+            arguments, directory = payload
+
+            # Validate directory exists and is a dir (with a single stat call)
+            try:
+                is_dir = stat.S_ISDIR(os.stat(directory).st_mode)
+            except OSError:
+                is_dir = False
+            if not is_dir:
+                return _error_response(f"Invalid directory: {Path(directory)}")
 
             # Delegate to server
             result = server.handle_client({"arguments": arguments, "directory": directory})
-            return jsonify(result)
+            return _json_response(result)
 
         except Exception as e:
             output = {
                 "status": "Error",
                 "error_message": str(e),
                 "error_type": type(e).__name__,
-                "traceback": traceback.format_exc(),
             }
+            # By default, the traceback is kept out of the response and only logged on the server
+            if send_traceback:
+                import traceback
+
+                output["traceback"] = traceback.format_exc()
+            else:
+                logging.exception("Calculation request failed")
             # attach STDOUT if possible
             if isinstance(e, CalculatorRuntimeException):
                 output["stdout"] = e.stdout
-            return jsonify(output)
+            return _json_response(output)
 
     return app
 
@@ -516,8 +720,8 @@ class PrintAvailableMethods(Action):
 def cleanup_and_exit(
     signum: int,
     _: FrameType | None,
-    executor: concurrent.futures.ProcessPoolExecutor,
-    parser: argparse.ArgumentParser,
+    executor: ProcessPoolExecutor,
+    parser: ArgumentParser,
 ) -> None:
     """
     Handle termination signals by shutting down the executor and exiting the process.
@@ -529,10 +733,10 @@ def cleanup_and_exit(
     frame : FrameType or None
         The current stack frame at the moment the signal was received, supplied
         automatically by the Python signal machinery. Typically unused.
-    executor : concurrent.futures.ProcessPoolExecutor
+    executor : ProcessPoolExecutor
         The process pool executor whose worker processes should be terminated
         cleanly before exiting.
-    parser : argparse.ArgumentParser
+    parser : ArgumentParser
         The argument parser whose ``exit()`` method is used to terminate the program.
     """
     print(f"PID {os.getpid()} received signal {signum}, shutting down...")
@@ -540,12 +744,39 @@ def cleanup_and_exit(
     parser.exit(0)
 
 
-def worker_initializer() -> None:
-    """Initialize a worker process by restoring default signal handling."""
+def worker_initializer(calc_module: str, calc_class: str, max_memory_per_thread: int) -> None:
+    """
+    Initialize a worker process by restoring default signal handling and storing the worker settings.
+    Also imports the calculator class, so that neither the first nor any later request pays for the import.
+
+    Parameters
+    ----------
+    calc_module: str
+        Module of the calculator used by the server
+    calc_class: str
+        Calculator type
+    max_memory_per_thread: int
+        Maximum memory in MiB
+    """
+    global _WORKER_CALC_TYPE, _WORKER_MAX_MEMORY
     signal.signal(signal.SIGTERM, signal.SIG_DFL)
     signal.signal(signal.SIGINT, signal.SIG_DFL)
     if sys.platform != "win32":
         signal.signal(signal.SIGHUP, signal.SIG_DFL)
+    _WORKER_MAX_MEMORY = max_memory_per_thread
+    _WORKER_CALC_TYPE = getattr(importlib.import_module(calc_module), calc_class)
+
+
+def _warm_up_worker() -> int:
+    """
+    Dummy job used to start the worker processes (and thereby run `worker_initializer`) at startup.
+
+    Returns
+    -------
+    int
+        PID of the worker process
+    """
+    return os.getpid()
 
 
 def main() -> None:
@@ -571,7 +802,7 @@ def main() -> None:
         metavar="hostname:port",
         default="127.0.0.1:8888",
         dest="host_port",
-        help="Server bind address and port. Default: 127.0.0.1:8888.",
+        help="Server bind address and port or unix:/path/to/socket. Default: 127.0.0.1:8888.",
     )
     parser.add_argument(
         "-n",
@@ -603,7 +834,7 @@ def main() -> None:
         "--verbose",
         action="store_true",
         dest="verbose",
-        help="Print additional output.",
+        help="Print additional output and send the full traceback of errors to the client.",
     )
 
     # First parse only the known args to get method/nthreads/etc.
@@ -617,38 +848,82 @@ def main() -> None:
     if ignored_args:
         logging.warning("The following arguments will be ignored: " + " ".join(ignored_args))
 
-    signal.signal(signal.SIGTERM, lambda s, f: cleanup_and_exit(s, f, executor, parser))
-    signal.signal(signal.SIGINT, lambda s, f: cleanup_and_exit(s, f, executor, parser))
-    if sys.platform != "win32":
-        signal.signal(signal.SIGHUP, lambda s, f: cleanup_and_exit(s, f, executor, parser))
+    # Make a CalculatorClass getting the hooks on calculators argument parsing
+    # Info on calculator type is store in the object for client requests
+    # This also makes sure the calculator can be imported before any worker is started
+    calcClass = CalculatorClass(args.method)
 
     # Create workers
     workers = args.nthreads
-    # Use spawn start method so CUDA can be initialized safely in worker processes
-    mp_ctx = mp.get_context("spawn")
+    # Workers must not be forked from this (multithreaded) process, so that CUDA can be
+    # initialized safely in the worker processes. On Linux, use a fork server that imports
+    # the calculator once: the workers are then forked from it with all heavy modules
+    # (torch, numpy, ...) already loaded and shared. Elsewhere, use spawn: on macOS, system
+    # libraries may start threads on import, which makes forking from the fork server unsafe.
+    mp_ctx: BaseContext
+    if sys.platform.startswith("linux"):
+        forkserver_ctx = mp.get_context("forkserver")
+        forkserver_ctx.set_forkserver_preload([__name__, calcClass.import_module])
+        mp_ctx = forkserver_ctx
+    else:
+        mp_ctx = mp.get_context("spawn")
     # Initialize the ProcessPool
     executor = ProcessPoolExecutor(
-        max_workers=workers, initializer=worker_initializer, mp_context=mp_ctx
+        max_workers=workers,
+        initializer=worker_initializer,
+        initargs=(calcClass.import_module, calcClass.calculator_name, args.memory_per_thread),
+        mp_context=mp_ctx,
     )
-
-    # Make a CalculatorClass getting the hooks on calculators argument parsing
-    # Info on calculator type is store in the object for client requests
-    calcClass = CalculatorClass(args.method)
+    # Register the handlers only once the executor they shut down exists. Before, e.g., during
+    # the (potentially slow) calculator import, the default handlers simply stop the process.
+    signal.signal(signal.SIGTERM, lambda s, f: cleanup_and_exit(s, f, executor, parser))
+    signal.signal(signal.SIGINT, lambda s, f: cleanup_and_exit(s, f, executor, parser))
+    if sys.platform != "win32":
+        signal.signal(signal.SIGHUP, lambda s, f: cleanup_and_exit(s, f, executor, parser))
+    # Start all workers right away, so the (potentially heavy) calculator import
+    # is done at startup and not when the first requests arrive
+    logging.info(f"Starting {workers} worker process(es)...")
+    warm_up = [executor.submit(_warm_up_worker) for _ in range(workers)]
+    try:
+        pids = {future.result() for future in warm_up}
+    except BrokenExecutor as e:
+        # E.g., the calculator cannot be imported in the workers. Fail now and not with the first request.
+        executor.shutdown(wait=False, cancel_futures=True)
+        parser.error(f"Failed to start the worker processes: {e!r}")
+    logging.debug(f"Worker processes started with PIDs: {sorted(pids)}")
 
     # Then initialize a server instance that uses the calc_class
     server = OtoolServer(
         calc_class=calcClass,
         total_cores=args.nthreads,  # or another CLI flag like --total-cores
         executor=executor,
-        max_memory_per_thread=args.memory_per_thread,
     )
 
     # Start the server
-    host, port = args.host_port.split(":")
-    app = create_app(server)
+    # Waitress is only needed here, not by the worker processes that import this module
+    from waitress import serve
+
+    app = create_app(server, send_traceback=args.verbose)
     # Waitress will create a thread per incoming request (bounded by 'threads').
     # Each request acquires/releases a calculator safely.
-    serve(app, host=host, port=int(port), threads=args.nthreads)
+    # The request threads only wait for the worker processes, the actual compute is bounded
+    # by the core limiter. Some additional threads keep the server responsive (e.g. /healthz
+    # or rejecting invalid requests) while all cores are busy.
+    threads = args.nthreads + _EXTRA_REQUEST_THREADS
+    if args.host_port.startswith(UNIX_SOCKET_PREFIX):
+        # Clients on the same machine can connect via a Unix domain socket without any TCP overhead.
+        # The socket is only accessible by the user who started the server.
+        if not hasattr(socket, "AF_UNIX"):
+            parser.error("Unix domain sockets are not supported on this platform.")
+        serve(
+            app,
+            unix_socket=args.host_port.removeprefix(UNIX_SOCKET_PREFIX),
+            unix_socket_perms="600",
+            threads=threads,
+        )
+    else:
+        host, port = args.host_port.split(":")
+        serve(app, host=host, port=int(port), threads=threads)
 
 
 if __name__ == "__main__":
@@ -1,78 +1,36 @@
-import os
-import signal
+import socket
 import subprocess
-import time
+import tempfile
 import unittest
 
 from oet import ROOT_DIR
 from oet.core.test_utilities import (
     OH,
     WATER,
-    get_filenames,
-    read_result_file,
-    run_wrapper,
-    write_input_file,
-    write_xyz_file,
+    EngradCase,
+    check_engrad_case,
+    run_client,
+    start_server,
+    stop_server,
+    wait_for_server,
+    write_engrad_case,
 )
 
 # Path to the scripts, adjust if needed.
-aimnet2_script_path = ROOT_DIR / "../../bin/oet_client"
 aimnet2_server_path = ROOT_DIR / "../../bin/oet_server"
 # Default ID and port of server. Change if needed
 id_port = "127.0.0.1:9000"
 
 
-def run_aimnet2(inputfile: str, output_file: str) -> None:
-    run_wrapper(
-        inputfile=inputfile,
-        script_path=aimnet2_script_path,
-        outfile=output_file,
-        args=["--bind", id_port],
-    )
-
-
-class Aimnet2Tests(unittest.TestCase):
-    @classmethod
-    def setUpClass(cls):
-        """
-        Test starting the server
-        """
-        print("Starting the server. A detailed server log can be found on file server.out")
-        with open("server.out", "a") as f:
-            cls.server = subprocess.Popen(
-                [aimnet2_server_path, "aimnet2", "--bind", id_port, "--nthreads", "2"],
-                stdout=f,
-                stderr=subprocess.STDOUT,
-                preexec_fn=os.setsid,
-            )
-        # Wait a little to make sure it is setup
-        time.sleep(5)
-
-    @classmethod
-    def tearDownClass(cls):
-        """
-        Shut the server at the end
-        """
-        print("Killing the server.")
-        os.killpg(os.getpgid(cls.server.pid), signal.SIGTERM)
-        cls.server.wait(timeout=10)
-
-    def test_H2O_engrad(self):
-        xyz_file, input_file, engrad_out, output_file = get_filenames("H2O_client")
-
-        write_xyz_file(xyz_file, WATER)
-        write_input_file(
-            filename=input_file,
-            xyz_filename=xyz_file,
-            charge=0,
-            multiplicity=1,
-            ncores=2,
-            do_gradient=1,
-        )
-        run_aimnet2(input_file, output_file)
-        expected_num_atoms = 3
-        expected_energy = -7.647682644970e+01
-        expected_gradients = [
+# Test cases with reference energy (Eh) and gradient (Eh/Bohr)
+CASES = (
+    EngradCase(
+        name="H2O_client",
+        atoms=WATER,
+        charge=0,
+        multiplicity=1,
+        energy=-7.647682644970e01,
+        gradients=(
             -1.020941790193e-02,
             -7.558942306787e-03,
             5.339907016605e-03,
@@ -81,90 +39,104 @@ class Aimnet2Tests(unittest.TestCase):
             1.832915237173e-03,
             6.631625350565e-03,
             -1.464942586608e-03,
-            -7.172828074545e-03
-        ]
-
-        try:
-            num_atoms, energy, gradients = read_result_file(engrad_out)
-        except Exception as e:
-            raise FileNotFoundError(
-                f"Error wrapper outputfile not found. Check {output_file} for details"
-            ) from e
-
-        self.assertEqual(num_atoms, expected_num_atoms)
-        self.assertAlmostEqual(energy, expected_energy, places=9)
-        for g1, g2 in zip(gradients, expected_gradients):
-            self.assertAlmostEqual(g1, g2, places=9)
-
-    def test_OH_anion_eng_grad(self):
-        xyz_file, input_file, engrad_out, output_file = get_filenames("OH_anion_client")
-        write_xyz_file(xyz_file, OH)
-        write_input_file(
-            filename=input_file,
-            xyz_filename=xyz_file,
-            charge=-1,
-            multiplicity=1,
-            ncores=2,
-            do_gradient=1,
-        )
-        run_aimnet2(input_file, output_file)
-        expected_num_atoms = 2
-        expected_energy = -7.582629740302e+01
-        expected_gradients = [
+            -7.172828074545e-03,
+        ),
+    ),
+    EngradCase(
+        name="OH_anion_client",
+        atoms=OH,
+        charge=-1,
+        multiplicity=1,
+        energy=-7.582629740302e01,
+        gradients=(
             -4.858186002821e-04,
             -1.563774305396e-03,
             -4.455401503947e-04,
             4.858186002821e-04,
             1.563771977089e-03,
-            4.455401503947e-04
-        ]
-
-        try:
-            num_atoms, energy, gradients = read_result_file(engrad_out)
-        except Exception as e:
-            raise FileNotFoundError(
-                f"Error wrapper outputfile not found. Check {output_file} for details"
-            ) from e
-
-        self.assertEqual(num_atoms, expected_num_atoms)
-        self.assertAlmostEqual(energy, expected_energy, places=9)
-        for g1, g2 in zip(gradients, expected_gradients):
-            self.assertAlmostEqual(g1, g2, places=9)
-
-    def test_OH_rad_eng_grad(self):
-        xyz_file, input_file, engrad_out, output_file = get_filenames("OH_rad_client")
-        write_xyz_file(xyz_file, OH)
-        write_input_file(
-            filename=input_file,
-            xyz_filename=xyz_file,
-            charge=0,
-            multiplicity=2,
-            ncores=2,
-            do_gradient=1,
-        )
-        run_aimnet2(input_file, output_file)
-        expected_num_atoms = 2
-        expected_energy = -7.568258800204e+01
-        expected_gradients = [
+            4.455401503947e-04,
+        ),
+    ),
+    EngradCase(
+        name="OH_rad_client",
+        atoms=OH,
+        charge=0,
+        multiplicity=2,
+        energy=-7.568258800204e01,
+        gradients=(
             -3.783911699429e-03,
             -1.217970903963e-02,
             -3.470176830888e-03,
             3.783911699429e-03,
             1.217970997095e-02,
-            3.470176830888e-03
-        ]
-
-        try:
-            num_atoms, energy, gradients = read_result_file(engrad_out)
-        except Exception as e:
-            raise FileNotFoundError(
-                f"Error wrapper outputfile not found. Check {output_file} for details"
-            ) from e
-
-        self.assertEqual(num_atoms, expected_num_atoms)
-        self.assertAlmostEqual(energy, expected_energy, places=7)
-        for g1, g2 in zip(gradients, expected_gradients):
-            self.assertAlmostEqual(g1, g2, places=7)
+            3.470176830888e-03,
+        ),
+        places=7,
+    ),
+)
+
+
+def run_aimnet2(inputfile: str, output_file: str) -> int:
+    # The client runs in the test process, only the server is a separate process
+    return run_client(inputfile=inputfile, host_port=id_port, outfile=output_file)
+
+
+# Server process shared by all tests of this module
+server: subprocess.Popen | None = None
+
+
+def setUpModule():
+    """
+    Start the server once for all tests of this module
+    """
+    global server
+    server = start_server([aimnet2_server_path, "aimnet2", "--bind", id_port, "--nthreads", "2"])
+    # Wait until the server accepts connections
+    # tearDownModule is not called if this fails, so stop the server here
+    try:
+        wait_for_server(id_port, server)
+    except RuntimeError:
+        tearDownModule()
+        raise
+
+
+def tearDownModule():
+    """
+    Shut the server at the end
+    """
+    if server is None:
+        return
+    print("Killing the server.")
+    stop_server(server)
+
+
+class Aimnet2Tests(unittest.TestCase):
+    def test_engrad(self):
+        for case in CASES:
+            with self.subTest(case.name):
+                _, input_file, engrad_out, output_file = write_engrad_case(case)
+                exit_code = run_aimnet2(input_file, output_file)
+                check_engrad_case(self, case, engrad_out, output_file, exit_code)
+
+    @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix domain sockets are not supported")
+    def test_engrad_unix_socket(self):
+        # Same calculation, but the client talks to a second server via a Unix domain socket
+        case = CASES[0]._replace(name="H2O_client_unix")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            socket_path = f"unix:{tmp_dir}/oet.sock"
+            unix_server = start_server(
+                [aimnet2_server_path, "aimnet2", "--bind", socket_path, "--nthreads", "2"],
+                logfile="server_unix.out",
+            )
+            try:
+                wait_for_server(socket_path, unix_server)
+                _, input_file, engrad_out, output_file = write_engrad_case(case)
+                exit_code = run_client(
+                    inputfile=input_file, host_port=socket_path, outfile=output_file
+                )
+            finally:
+                stop_server(unix_server)
+        check_engrad_case(self, case, engrad_out, output_file, exit_code)
 
 
 if __name__ == "__main__":
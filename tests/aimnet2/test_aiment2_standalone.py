@@ -4,38 +4,25 @@ from oet import ROOT_DIR
 from oet.core.test_utilities import (
     OH,
     WATER,
-    get_filenames,
-    read_result_file,
+    EngradCase,
+    check_engrad_case,
     run_wrapper,
-    write_input_file,
-    write_xyz_file,
+    write_engrad_case,
 )
 
 # Path to the script, adjust if needed.
 aimnet2_script_path = ROOT_DIR / "../../bin/oet_aimnet2"
 
 
-def run_aimnet2(inputfile: str, output_file: str) -> None:
-    run_wrapper(inputfile=inputfile, script_path=aimnet2_script_path, outfile=output_file)
-
-
-class Aimnet2Tests(unittest.TestCase):
-    def test_H2O_engrad(self):
-        xyz_file, input_file, engrad_out, output_file = get_filenames("H2O")
-
-        write_xyz_file(xyz_file, WATER)
-        write_input_file(
-            filename=input_file,
-            xyz_filename=xyz_file,
-            charge=0,
-            multiplicity=1,
-            ncores=2,
-            do_gradient=1,
-        )
-        run_aimnet2(input_file, output_file)
-        expected_num_atoms = 3
-        expected_energy = -7.647682644970e+01
-        expected_gradients = [
+# Test cases with reference energy (Eh) and gradient (Eh/Bohr)
+CASES = (
+    EngradCase(
+        name="H2O",
+        atoms=WATER,
+        charge=0,
+        multiplicity=1,
+        energy=-7.647682644970e01,
+        gradients=(
             -1.020941790193e-02,
             -7.558942306787e-03,
             5.339907016605e-03,
@@ -44,90 +31,54 @@ class Aimnet2Tests(unittest.TestCase):
             1.832915237173e-03,
             6.631625350565e-03,
             -1.464942586608e-03,
-            -7.172828074545e-03
-        ]
-
-        try:
-            num_atoms, energy, gradients = read_result_file(engrad_out)
-        except Exception as e:
-            raise FileNotFoundError(
-                f"Error wrapper outputfile not found. Check {output_file} for details"
-            ) from e
-
-        self.assertEqual(num_atoms, expected_num_atoms)
-        self.assertAlmostEqual(energy, expected_energy, places=9)
-        for g1, g2 in zip(gradients, expected_gradients):
-            self.assertAlmostEqual(g1, g2, places=9)
-
-    def test_OH_anion_eng_grad(self):
-        xyz_file, input_file, engrad_out, output_file = get_filenames("OH_ainion")
-        write_xyz_file(xyz_file, OH)
-        write_input_file(
-            filename=input_file,
-            xyz_filename=xyz_file,
-            charge=-1,
-            multiplicity=1,
-            ncores=2,
-            do_gradient=1,
-        )
-        run_aimnet2(input_file, output_file)
-        expected_num_atoms = 2
-        expected_energy = -7.582629740302e+01
-        expected_gradients = [
+            -7.172828074545e-03,
+        ),
+    ),
+    EngradCase(
+        name="OH_ainion",
+        atoms=OH,
+        charge=-1,
+        multiplicity=1,
+        energy=-7.582629740302e01,
+        gradients=(
             -4.858186002821e-04,
             -1.563774305396e-03,
             -4.455401503947e-04,
             4.858186002821e-04,
             1.563771977089e-03,
-            4.455401503947e-04
-        ]
-
-        try:
-            num_atoms, energy, gradients = read_result_file(engrad_out)
-        except Exception as e:
-            raise FileNotFoundError(
-                f"Error wrapper outputfile not found. Check {output_file} for details"
-            ) from e
-
-        self.assertEqual(num_atoms, expected_num_atoms)
-        self.assertAlmostEqual(energy, expected_energy, places=9)
-        for g1, g2 in zip(gradients, expected_gradients):
-            self.assertAlmostEqual(g1, g2, places=9)
-
-    def test_OH_rad_eng_grad(self):
-        xyz_file, input_file, engrad_out, output_file = get_filenames("OH_rad")
-        write_xyz_file(xyz_file, OH)
-        write_input_file(
-            filename=input_file,
-            xyz_filename=xyz_file,
-            charge=0,
-            multiplicity=2,
-            ncores=2,
-            do_gradient=1,
-        )
-        run_aimnet2(input_file, output_file)
-        expected_num_atoms = 2
-        expected_energy = -7.568258800204e+01
-        expected_gradients = [
+            4.455401503947e-04,
+        ),
+    ),
+    EngradCase(
+        name="OH_rad",
+        atoms=OH,
+        charge=0,
+        multiplicity=2,
+        energy=-7.568258800204e01,
+        gradients=(
             -3.783911699429e-03,
             -1.217970903963e-02,
             -3.470176830888e-03,
             3.783911699429e-03,
             1.217970997095e-02,
-            3.470176830888e-03
-        ]
+            3.470176830888e-03,
+        ),
+        places=7,
+    ),
+)
 
-        try:
-            num_atoms, energy, gradients = read_result_file(engrad_out)
-        except Exception as e:
-            raise FileNotFoundError(
-                f"Error wrapper outputfile not found. Check {output_file} for details"
-            ) from e
 
-        self.assertEqual(num_atoms, expected_num_atoms)
-        self.assertAlmostEqual(energy, expected_energy, places=7)
-        for g1, g2 in zip(gradients, expected_gradients):
-            self.assertAlmostEqual(g1, g2, places=7)
+def run_aimnet2(inputfile: str, output_file: str) -> int:
+    return run_wrapper(inputfile=inputfile, script_path=aimnet2_script_path, outfile=output_file)
+
+
+class Aimnet2Tests(unittest.TestCase):
+    def test_engrad(self):
+        for case in CASES:
+            with self.subTest(case.name):
+                _, input_file, engrad_out, output_file = write_engrad_case(case)
+                exit_code = run_aimnet2(input_file, output_file)
+                check_engrad_case(self, case, engrad_out, output_file, exit_code)
 
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 import unittest
+from pathlib import Path
 
 import torchani
 
@@ -6,13 +7,12 @@ from oet import ROOT_DIR
 from oet.core.test_utilities import (
     OH,
     WATER,
+    EngradCase,
     TimeoutCall,
     TimeoutCallError,
-    get_filenames,
-    read_result_file,
+    check_engrad_case,
     run_wrapper,
-    write_input_file,
-    write_xyz_file,
+    write_engrad_case,
 )
 
 # Path to the script, adjust if needed.
@@ -23,20 +23,87 @@ timeout = 300
 mlatom_executable_path = ""
 
 
-def run_mlatom(inputfile: str, output_file: str) -> None:
+# Test cases with reference energy (Eh) and gradient (Eh/Bohr)
+CASES = (
+    EngradCase(
+        name="H2O",
+        atoms=WATER,
+        charge=0,
+        multiplicity=1,
+        energy=-76.38342071002,
+        gradients=(
+            -9.34811007e-03,
+            -6.92128305e-03,
+            4.88938529e-03,
+            2.98246744e-03,
+            9.27055785e-03,
+            2.54374613e-03,
+            6.36564281e-03,
+            -2.34927474e-03,
+            -7.43313148e-03,
+        ),
+    ),
+    EngradCase(
+        name="OH_anion",
+        atoms=OH,
+        charge=-1,
+        multiplicity=1,
+        energy=-75.76385998084,
+        gradients=(
+            -1.07623156e-02,
+            -3.46419311e-02,
+            -9.86998337e-03,
+            1.07623156e-02,
+            3.46419311e-02,
+            9.86998337e-03,
+        ),
+    ),
+    EngradCase(
+        name="OH_rad",
+        atoms=OH,
+        charge=0,
+        multiplicity=2,
+        energy=-75.76385998084,
+        gradients=(
+            -1.07623156e-02,
+            -3.46419311e-02,
+            -9.86998337e-03,
+            1.07623156e-02,
+            3.46419311e-02,
+            9.86998337e-03,
+        ),
+    ),
+)
+
+
+def run_mlatom(inputfile: str, output_file: str) -> int:
     arguments = []
     if mlatom_executable_path:
         arguments = ["--exe", mlatom_executable_path]
     arguments.append("ANI-1ccx")
     # print(inputfile, arguments)
-    run_wrapper(
+    return run_wrapper(
         inputfile=inputfile, script_path=mlatom_script_path, outfile=output_file, args=arguments
     )
 
 
+def ani1ccx_files_present() -> bool:
+    """
+    Checks whether the ANI-1ccx model files were already downloaded by torchani.
+    torchani looks for them in its resources directory and in ~/.local/torchani.
+    """
+    info_file = "ani-1ccx_8x.info"
+    resource_info = Path(torchani.__file__).parent / "resources" / info_file
+    local_info = Path.home() / ".local" / "torchani" / info_file
+    return (resource_info.is_file() and resource_info.stat().st_size > 0) or local_info.is_file()
+
+
 class MLatomTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
+        # Nothing to download, if the model files are already there
+        if ani1ccx_files_present():
+            return
         # Force download / initialization of ANI-1ccx once
         print("Checking the model files and downloading them if necessary.")
         # Make a timeout call to avoid hanging forever
@@ -63,114 +130,12 @@ class MLatomTests(unittest.TestCase):
                 print("Could not load the model files.")
                 raise unittest.SkipTest("Loading failed.")
 
-    def test_H2O_engrad(self):
-        xyz_file, input_file, engrad_out, output_file = get_filenames("H2O")
-        write_xyz_file(xyz_file, WATER)
-        write_input_file(
-            filename=input_file,
-            xyz_filename=xyz_file,
-            charge=0,
-            multiplicity=1,
-            ncores=2,
-            do_gradient=1,
-        )
-        run_mlatom(input_file, output_file)
-
-        expected_num_atoms = 3
-        expected_energy = -76.38342071002
-        expected_gradients = [
-            -9.34811007e-03,
-            -6.92128305e-03,
-            4.88938529e-03,
-            2.98246744e-03,
-            9.27055785e-03,
-            2.54374613e-03,
-            6.36564281e-03,
-            -2.34927474e-03,
-            -7.43313148e-03,
-        ]
-
-        try:
-            num_atoms, energy, gradients = read_result_file(engrad_out)
-        except Exception as e:
-            raise FileNotFoundError(
-                f"Error wrapper outputfile not found. Check {output_file} for details"
-            ) from e
-
-        self.assertEqual(num_atoms, expected_num_atoms)
-        self.assertAlmostEqual(energy, expected_energy, places=9)
-        for g1, g2 in zip(gradients, expected_gradients):
-            self.assertAlmostEqual(g1, g2, places=9)
-
-    def test_OH_anion_eng_grad(self):
-        xyz_file, input_file, engrad_out, output_file = get_filenames("OH_anion")
-        write_xyz_file(xyz_file, OH)
-        write_input_file(
-            filename=input_file,
-            xyz_filename=xyz_file,
-            charge=-1,
-            multiplicity=1,
-            ncores=2,
-            do_gradient=1,
-        )
-        run_mlatom(input_file, output_file)
-        expected_num_atoms = 2
-        expected_energy = -75.76385998084
-        expected_gradients = [
-            -1.07623156e-02,
-            -3.46419311e-02,
-            -9.86998337e-03,
-            1.07623156e-02,
-            3.46419311e-02,
-            9.86998337e-03,
-        ]
-
-        try:
-            num_atoms, energy, gradients = read_result_file(engrad_out)
-        except Exception as e:
-            raise FileNotFoundError(
-                f"Error wrapper outputfile not found. Check {output_file} for details"
-            ) from e
-
-        self.assertEqual(num_atoms, expected_num_atoms)
-        self.assertAlmostEqual(energy, expected_energy, places=9)
-        for g1, g2 in zip(gradients, expected_gradients):
-            self.assertAlmostEqual(g1, g2, places=9)
-
-    def test_OH_rad_eng_grad(self):
-        xyz_file, input_file, engrad_out, output_file = get_filenames("OH_rad")
-        write_xyz_file(xyz_file, OH)
-        write_input_file(
-            filename=input_file,
-            xyz_filename=xyz_file,
-            charge=0,
-            multiplicity=2,
-            ncores=2,
-            do_gradient=1,
-        )
-        run_mlatom(input_file, output_file)
-        expected_num_atoms = 2
-        expected_energy = -75.76385998084
-        expected_gradients = [
-            -1.07623156e-02,
-            -3.46419311e-02,
-            -9.86998337e-03,
-            1.07623156e-02,
-            3.46419311e-02,
-            9.86998337e-03,
-        ]
-
-        try:
-            num_atoms, energy, gradients = read_result_file(engrad_out)
-        except Exception as e:
-            raise FileNotFoundError(
-                f"Error wrapper outputfile not found. Check {output_file} for details"
-            ) from e
-
-        self.assertEqual(num_atoms, expected_num_atoms)
-        self.assertAlmostEqual(energy, expected_energy, places=9)
-        for g1, g2 in zip(gradients, expected_gradients):
-            self.assertAlmostEqual(g1, g2, places=9)
+    def test_engrad(self):
+        for case in CASES:
+            with self.subTest(case.name):
+                _, input_file, engrad_out, output_file = write_engrad_case(case)
+                exit_code = run_mlatom(input_file, output_file)
+                check_engrad_case(self, case, engrad_out, output_file, exit_code)
 
 
 if __name__ == "__main__":
@@ -1,49 +1,34 @@
+import shutil
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 from oet import ROOT_DIR
 from oet.core.test_utilities import (
     OH,
     WATER,
-    get_filenames,
-    read_result_file,
+    EngradCase,
+    check_engrad_case,
     run_wrapper,
-    write_input_file,
-    write_xyz_file,
+    write_engrad_case,
 )
 
 # Path to the script, adjust if needed.
 mopac_script_path = ROOT_DIR / "../../bin/oet_mopac"
 # Leave moppac_executable_path empty, if mopac from system path should be called
 mopac_executable_path = ""
-
-
-def run_mopac(inputfile: str, output_file: str) -> None:
-    if mopac_executable_path:
-        arguments = ["--exe", mopac_executable_path]
-    else:
-        arguments = None
-    run_wrapper(
-        inputfile=inputfile, script_path=mopac_script_path, outfile=output_file, args=arguments
-    )
-
-
-class MopacTests(unittest.TestCase):
-    def test_H2O_engrad(self):
-        xyz_file, input_file, engrad_out, output_file = get_filenames("OH")
-        write_xyz_file(xyz_file, WATER)
-        write_input_file(
-            filename=input_file,
-            xyz_filename=xyz_file,
-            charge=0,
-            multiplicity=1,
-            ncores=2,
-            do_gradient=1,
-        )
-        run_mopac(input_file, output_file)
-
-        expected_num_atoms = 3
-        expected_energy = -7.849286623778e-02
-        expected_gradients = [
+# Without an executable, there is nothing to test
+mopac_available = bool(mopac_executable_path) or shutil.which("mopac") is not None
+
+
+# Test cases with reference energy (Eh) and gradient (Eh/Bohr)
+CASES = (
+    EngradCase(
+        name="H2O",
+        atoms=WATER,
+        charge=0,
+        multiplicity=1,
+        energy=-7.849286623778e-02,
+        gradients=(
             -7.93660235e-03,
             -5.85955298e-03,
             4.14782376e-03,
@@ -53,88 +38,62 @@ class MopacTests(unittest.TestCase):
             1.35399706e-03,
             1.19519178e-02,
             5.67494573e-03,
-        ]
-        try:
-            num_atoms, energy, gradients = read_result_file(engrad_out)
-        except Exception as e:
-            raise FileNotFoundError(
-                f"Error wrapper outputfile not found. Check {output_file} for details"
-            ) from e
-
-        self.assertEqual(num_atoms, expected_num_atoms)
-        self.assertAlmostEqual(energy, expected_energy, places=9)
-        for g1, g2 in zip(gradients, expected_gradients):
-            self.assertAlmostEqual(g1, g2, places=9)
-
-    def test_OH_anion_eng_grad(self):
-        xyz_file, input_file, engrad_out, output_file = get_filenames("OH_anion")
-        write_xyz_file(xyz_file, OH)
-        write_input_file(
-            filename=input_file,
-            xyz_filename=xyz_file,
-            charge=-1,
-            multiplicity=1,
-            ncores=2,
-            do_gradient=1,
-        )
-        run_mopac(input_file, output_file)
-        expected_num_atoms = 2
-        expected_energy = -4.909937546712478e-02
-        expected_gradients = [
+        ),
+    ),
+    EngradCase(
+        name="OH_anion",
+        atoms=OH,
+        charge=-1,
+        multiplicity=1,
+        energy=-4.909937546712478e-02,
+        gradients=(
             -1.08238184e-02,
             -3.48519301e-02,
             -9.92625736e-03,
             1.08238184e-02,
             3.48519301e-02,
             9.92625736e-03,
-        ]
-
-        try:
-            num_atoms, energy, gradients = read_result_file(engrad_out)
-        except Exception as e:
-            raise FileNotFoundError(
-                f"Error wrapper outputfile not found. Check {output_file} for details"
-            ) from e
-
-        self.assertEqual(num_atoms, expected_num_atoms)
-        self.assertAlmostEqual(energy, expected_energy, places=9)
-        for g1, g2 in zip(gradients, expected_gradients):
-            self.assertAlmostEqual(g1, g2, places=9)
-
-    def test_OH_rad_eng_grad(self):
-        xyz_file, input_file, engrad_out, output_file = get_filenames("OH_rad")
-        write_xyz_file(xyz_file, OH)
-        write_input_file(
-            filename=input_file,
-            xyz_filename=xyz_file,
-            charge=0,
-            multiplicity=2,
-            ncores=2,
-            do_gradient=1,
-        )
-        run_mopac(input_file, output_file)
-        expected_num_atoms = 2
-        expected_energy = 0.0212775115576
-        expected_gradients = [
+        ),
+    ),
+    EngradCase(
+        name="OH_rad",
+        atoms=OH,
+        charge=0,
+        multiplicity=2,
+        energy=0.0212775115576,
+        gradients=(
             1.41467827e-03,
             4.53843190e-03,
             1.29739489e-03,
             -1.41467827e-03,
             -4.53843190e-03,
             -1.29739489e-03,
-        ]
+        ),
+    ),
+)
 
-        try:
-            num_atoms, energy, gradients = read_result_file(engrad_out)
-        except Exception as e:
-            raise FileNotFoundError(
-                f"Error wrapper outputfile not found. Check {output_file} for details"
-            ) from e
 
-        self.assertEqual(num_atoms, expected_num_atoms)
-        self.assertAlmostEqual(energy, expected_energy, places=9)
-        for g1, g2 in zip(gradients, expected_gradients):
-            self.assertAlmostEqual(g1, g2, places=9)
+def run_mopac(inputfile: str, output_file: str) -> int:
+    if mopac_executable_path:
+        arguments = ["--exe", mopac_executable_path]
+    else:
+        arguments = None
+    return run_wrapper(
+        inputfile=inputfile, script_path=mopac_script_path, outfile=output_file, args=arguments
+    )
+
+
+@unittest.skipUnless(mopac_available, "MOPAC executable not found")
+class MopacTests(unittest.TestCase):
+    def test_engrad(self):
+        # The cases are independent, so their wrappers run at the same time.
+        # A single MOPAC thread is enough for two or three atoms.
+        files = [write_engrad_case(case, ncores=1) for case in CASES]
+        with ThreadPoolExecutor(max_workers=len(CASES)) as pool:
+            exit_codes = list(pool.map(run_mopac, [f[1] for f in files], [f[3] for f in files]))
+        for case, (_, _, engrad_out, output_file), exit_code in zip(CASES, files, exit_codes):
+            with self.subTest(case.name):
+                check_engrad_case(self, case, engrad_out, output_file, exit_code)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,82 @@
+"""
+Makes sure the UMA model files used by the UMA tests are available
+"""
+
+import os
+import unittest
+from importlib.util import find_spec
+
+from oet.core.test_utilities import TimeoutCall, TimeoutCallError
+
+
+def cache_model_files(
+    basemodel: str, param: str = "omol", device: str = "cpu", cache_dir: str | None = None
+) -> None:
+    """
+    Wrapper to set up an UMA calculator that downloads the model files into the same cache-directory used for actual oet calculations.
+
+    basemodel: str
+        Basemodel used to calculate the test cases
+    param: str, default: omol
+        Parameter set.
+    device str, default: cpu
+        Device used for the calculations.
+    cache_dir: str | None, default: None
+        The cache directory used to store the model data. If None, DEFAULT_CACHE_DIR is used.
+    """
+    from oet.calculator.uma import DEFAULT_CACHE_DIR, UmaCalc
+
+    calculator = UmaCalc()
+    cache_dir = cache_dir or DEFAULT_CACHE_DIR
+    calculator.set_calculator(param=param, basemodel=basemodel, device=device, cache_dir=cache_dir)
+
+
+def ensure_model_files(basemodel: str, timeout: float = 600) -> None:
+    """
+    Download the UMA model files, if they are not in the cache directory yet.
+    Raises unittest.SkipTest if fairchem is not installed or the files cannot be loaded.
+
+    Parameters
+    ----------
+    basemodel: str
+        Basemodel used to calculate the test cases
+    timeout: float, default: 600
+        Maximum time (in sec) to download the model files if not present
+    """
+    # Importing the UMA calculator exits if fairchem is missing, so check for it first
+    if find_spec("fairchem") is None:
+        raise unittest.SkipTest("fairchem-core is not installed.")
+    # Download with hf_transfer if it is installed. huggingface_hub reads
+    # the setting on import, so it must be set before importing the calculator.
+    if find_spec("hf_transfer") is not None:
+        os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+    from oet.calculator.uma import DEFAULT_CACHE_DIR, UmaCalc
+
+    # Nothing to download, if the model files are already there
+    if UmaCalc().check_for_model_files(basemodel=basemodel, cache_dir=DEFAULT_CACHE_DIR):
+        return
+    # Pre-download UMA model files
+    print("Checking the model files and downloading them if necessary.")
+    # Make a timeout call to avoid hanging forever
+    get_pretrained_mlip_timeout = TimeoutCall(fn=cache_model_files)
+    ok, payload = get_pretrained_mlip_timeout(basemodel, timeout=timeout)
+    # Check if the model files could not be loaded
+    if not ok:
+        # Timeout
+        if payload == TimeoutCallError.TIMEOUT:
+            print(
+                "Loading the model files timed out. "
+                "Please check your internet connection and consider increasing the time before timing out."
+            )
+            raise unittest.SkipTest("Timed out.")
+        # General errors and crashes
+        elif payload == TimeoutCallError.CRASH or payload == TimeoutCallError.ERROR:
+            print(
+                "Loading the model files failed. Make sure that "
+                "the virtual environment with UMA installed is active."
+            )
+            raise unittest.SkipTest("Loading failed.")
+        # Unresolved error
+        else:
+            print("Could not load the model files.")
+            raise unittest.SkipTest("Loading failed.")